@@ -306,11 +306,18 @@ def build(fmt: str, oversample: float) -> None:
 
 
 @training.command("synthetic")
-def build_synthetic() -> None:
+@click.option("--parquet", is_flag=True, help="Also write a columnar Parquet copy (requires pyarrow)")
+@click.option("--arrow", is_flag=True, help="Also write a memory-mappable Arrow IPC copy (requires pyarrow)")
+def build_synthetic(parquet: bool, arrow: bool) -> None:
     """Generate synthetic training dialogues."""
-    from cantor.training.synthetic import generate_all, export_synthetic
-
-    examples = generate_all()
+    from cantor.training.synthetic import (
+        export_synthetic,
+        export_synthetic_arrow,
+        export_synthetic_parquet,
+        load_cached_corpus,
+    )
+
+    examples = load_cached_corpus()
     path = export_synthetic(examples)
     table = Table(title=f"Synthetic examples: {len(examples)}")
     table.add_column("Category")
@@ -322,6 +329,12 @@ def build_synthetic() -> None:
         table.add_row(cat, str(cnt))
     console.print(table)
     console.print(f"[green]Exported to {path}[/green]")
+    if parquet:
+        pq_path = export_synthetic_parquet(examples)
+        console.print(f"[green]Exported to {pq_path}[/green]")
+    if arrow:
+        arrow_path = export_synthetic_arrow(examples)
+        console.print(f"[green]Exported to {arrow_path}[/green]")
 
 
 @training.command("negative")
@@ -404,6 +417,28 @@ def merge_model(preset: str, adapter_path: str, output_path: str) -> None:
     console.print(f"[green]Merged model saved to {output_path}[/green]")
 
 
+@finetune.command("pretokenize")
+@click.option("--preset", default="8b-qlora", help="Model preset whose tokenizer to use")
+@click.option("--tokenizer", "tokenizer_name", default=None, help="Override tokenizer path/name")
+def pretokenize(preset: str, tokenizer_name: str | None) -> None:
+    """Tokenize the synthetic corpus once and cache the token IDs."""
+    from transformers import AutoTokenizer
+
+    from cantor.finetune.config import PRESETS, ModelConfig
+    from cantor.finetune.dataset import (
+        build_tokenized_corpus,
+        load_tokenized_corpus,
+        write_token_memmap,
+    )
+
+    cfg = PRESETS.get(preset, ModelConfig())
+    tokenizer = AutoTokenizer.from_pretrained(tokenizer_name or cfg.base_model, trust_remote_code=True)
+    path = build_tokenized_corpus(tokenizer)
+    console.print(f"[green]Tokenized corpus saved to {path}[/green]")
+    tokens_path = write_token_memmap(load_tokenized_corpus(path))
+    console.print(f"[green]Packed token IDs saved to {tokens_path}[/green]")
+
+
 # ---------------------------------------------------------------------------
 # eval commands
 # ---------------------------------------------------------------------------
@@ -478,7 +513,7 @@ def pipeline(fmt: str) -> None:
     from cantor.annotate.tagger import tag_all_segments
     from cantor.training.sampler import WeightedSampler
     from cantor.training.formatter import export_training_data
-    from cantor.training.synthetic import generate_all, export_synthetic
+    from cantor.training.synthetic import load_cached_corpus, export_synthetic
     from cantor.training.negative import generate_all_negative, export_negative
 
     console.print("[bold cyan]Step 1/7: Initialize database[/bold cyan]")
@@ -510,7 +545,7 @@ def pipeline(fmt: str) -> None:
     console.print(f"  {tagged} segments annotated")
 
     console.print("\n[bold cyan]Step 6/7: Generate synthetic data[/bold cyan]")
-    synth = generate_all()
+    synth = load_cached_corpus()
     synth_path = export_synthetic(synth)
     console.print(f"  {len(synth)} synthetic examples -> {synth_path}")
     neg = generate_all_negative()
@@ -0,0 +1,392 @@
+"""Synthetic corpus plumbing for the fine-tuning data loader.
+
+Tokenization runs once at build time and the token IDs are persisted as
+``int32`` list columns, so training epochs read fixed-width integers instead
+of re-running the tokenizer over the same immutable strings.  The streaming
+dataset prefetches examples on a background thread so per-sample Python work
+overlaps with the training step.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+
+from cantor.training.synthetic import (
+    _DATA_DIR,
+    SyntheticExample,
+    as_arrow_table,
+    iter_all,
+    load_cached_corpus,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEPS_AVAILABLE = True
+_IMPORT_ERROR_MSG: str | None = None
+
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as exc:
+    _DEPS_AVAILABLE = False
+    _IMPORT_ERROR_MSG = (
+        f"Missing dataset dependencies ({exc}). "
+        "Install them with: pip install numpy pyarrow"
+    )
+
+
+_TORCH_AVAILABLE = True
+
+try:
+    import torch
+    from torch.utils.data import DataLoader, Dataset, IterableDataset
+except ImportError:
+    _TORCH_AVAILABLE = False
+    Dataset = IterableDataset = object
+
+
+def _check_deps() -> None:
+    if not _DEPS_AVAILABLE:
+        raise RuntimeError(_IMPORT_ERROR_MSG)
+
+
+def _check_torch() -> None:
+    if not _TORCH_AVAILABLE:
+        raise RuntimeError(
+            "Missing torch. Install the training dependencies with: pip install -e '.[train]'"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Build-time tokenization
+# ---------------------------------------------------------------------------
+
+def build_tokenized_corpus(
+    tokenizer,
+    examples: Iterable[SyntheticExample] | None = None,
+    output_dir: Path | None = None,
+) -> Path:
+    """Tokenize every synthetic example once and persist the IDs to Parquet.
+
+    The written table keeps the text columns alongside ``prompt_ids`` and
+    ``input_ids`` (``list<int32>``) for the user prompt and assistant
+    response respectively.  Each text column goes through the tokenizer in a
+    single batched call.  Returns the path of the written file.
+    """
+    _check_deps()
+
+    table = as_arrow_table(load_cached_corpus() if examples is None else examples)
+    if table.num_rows == 0:
+        raise ValueError("No examples to tokenize")
+
+    for text_col, ids_col in (("user_prompt", "prompt_ids"), ("assistant_response", "input_ids")):
+        encoded = tokenizer(table.column(text_col).to_pylist())["input_ids"]
+        table = table.append_column(ids_col, pa.array(encoded, type=pa.list_(pa.int32())))
+
+    out_dir = output_dir or _DATA_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / "synthetic_tokens.parquet"
+    pq.write_table(table, out_path, compression="zstd")
+    logger.info("Tokenized %d synthetic examples -> %s", table.num_rows, out_path)
+    return out_path
+
+
+def load_tokenized_corpus(path: Path | None = None) -> pa.Table:
+    """Load the table written by :func:`build_tokenized_corpus`."""
+    _check_deps()
+    return pq.read_table(path or _DATA_DIR / "synthetic_tokens.parquet", memory_map=True)
+
+
+def _flat_ids_and_offsets(table: pa.Table, column: str) -> tuple[np.ndarray, np.ndarray]:
+    """Flatten a ``list<int32>`` column into one token array plus row offsets.
+
+    Sequence ``i`` is ``tokens[offsets[i]:offsets[i + 1]]``.
+    """
+    ids = table.column(column).combine_chunks()
+    lengths = ids.value_lengths().to_numpy(zero_copy_only=False)
+    offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return ids.flatten().to_numpy(), offsets
+
+
+def write_token_memmap(
+    table: pa.Table,
+    column: str = "input_ids",
+    output_dir: Path | None = None,
+) -> Path:
+    """Pack one ``list<int32>`` column into a flat binary file plus offsets.
+
+    Writes ``synthetic_tokens.u32.bin`` (all sequences back to back, uint32)
+    and ``synthetic_offsets.i64.npy`` (``len + 1`` row boundaries).  Returns
+    the path of the token file.
+    """
+    _check_deps()
+    tokens, offsets = _flat_ids_and_offsets(table, column)
+
+    out_dir = output_dir or _DATA_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tokens_path = out_dir / "synthetic_tokens.u32.bin"
+    tokens.astype(np.uint32).tofile(tokens_path)
+    np.save(out_dir / "synthetic_offsets.i64.npy", offsets)
+    return tokens_path
+
+
+def load_token_memmap(data_dir: Path | None = None) -> tuple[np.memmap, np.ndarray]:
+    """Map the files written by :func:`write_token_memmap`.
+
+    Returns ``(tokens, offsets)``; sequence ``i`` is
+    ``tokens[offsets[i]:offsets[i + 1]]``, a zero-copy view whose pages are
+    shared through the OS page cache by every process mapping the file.
+    """
+    _check_deps()
+    data_dir = data_dir or _DATA_DIR
+    tokens = np.memmap(data_dir / "synthetic_tokens.u32.bin", dtype=np.uint32, mode="r")
+    offsets = np.load(data_dir / "synthetic_offsets.i64.npy")
+    return tokens, offsets
+
+
+def tokenize_all(
+    examples: Iterable[SyntheticExample],
+    tokenizer,
+    max_length: int | None = None,
+):
+    """Encode every (user_prompt, assistant_response) pair in one batched call.
+
+    Returns the tokenizer's ``BatchEncoding`` of padded ``pt`` tensors.
+    """
+    _check_torch()
+    examples = list(examples)
+    return tokenizer(
+        [ex.user_prompt for ex in examples],
+        [ex.assistant_response for ex in examples],
+        padding=True,
+        truncation=True,
+        max_length=max_length,
+        return_tensors="pt",
+    )
+
+
+class EncodedExampleDataset(Dataset):
+    """Map-style dataset over tensors encoded once by :func:`tokenize_all`."""
+
+    def __init__(
+        self,
+        examples: Iterable[SyntheticExample],
+        tokenizer,
+        max_length: int | None = None,
+    ) -> None:
+        self.encoding = tokenize_all(examples, tokenizer, max_length)
+
+    def __len__(self) -> int:
+        return len(self.encoding["input_ids"])
+
+    def __getitem__(self, idx: int) -> dict:
+        return {key: value[idx] for key, value in self.encoding.items()}
+
+
+# ---------------------------------------------------------------------------
+# Streaming dataset with background prefetch
+# ---------------------------------------------------------------------------
+
+_END = object()
+
+
+class _BackgroundIterator:
+    """Drain an iterator on a daemon thread into a bounded queue.
+
+    Call :meth:`close` (or drop the last reference) when abandoning the
+    iterator early; the producer thread then stops instead of blocking on a
+    full queue forever.
+    """
+
+    _PUT_TIMEOUT = 0.1
+
+    def __init__(self, source: Iterator, max_prefetch: int) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=max_prefetch)
+        self._errors: list[BaseException] = []
+        self._stop = threading.Event()
+        self._finished = False
+        # The thread gets the queue and event, not self, so an abandoned
+        # iterator can still be garbage collected and stop its producer.
+        self._thread = threading.Thread(
+            target=self._fill,
+            args=(source, self._queue, self._stop, self._errors),
+            daemon=True,
+        )
+        self._thread.start()
+
+    @classmethod
+    def _fill(
+        cls,
+        source: Iterator,
+        out: queue.Queue,
+        stop: threading.Event,
+        errors: list[BaseException],
+    ) -> None:
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    out.put(item, timeout=cls._PUT_TIMEOUT)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for item in source:
+                if not put(item):
+                    return
+        except BaseException as exc:
+            errors.append(exc)
+        put(_END)
+
+    def close(self) -> None:
+        """Stop the producer thread and discard any prefetched items."""
+        self._finished = True
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def __del__(self) -> None:
+        self._stop.set()
+
+    def __iter__(self) -> _BackgroundIterator:
+        return self
+
+    def __next__(self):
+        if self._finished:
+            raise StopIteration
+        item = self._queue.get()
+        if item is _END:
+            self._finished = True
+            if self._errors:
+                raise self._errors[0]
+            raise StopIteration
+        return item
+
+
+class SyntheticIterableDataset(IterableDataset):
+    """Stream synthetic examples, optionally transformed, with background prefetch.
+
+    *transform* (e.g. a tokenizing function) runs on the prefetch thread.
+    When used with several DataLoader workers, each worker takes every
+    ``num_workers``-th example so no example is produced twice.
+    """
+
+    def __init__(
+        self,
+        examples: Iterable[SyntheticExample] | None = None,
+        transform: Callable[[SyntheticExample], object] | None = None,
+        max_prefetch: int = 8,
+    ) -> None:
+        _check_torch()
+        self._examples = list(examples) if examples is not None else None
+        self.transform = transform
+        self.max_prefetch = max_prefetch
+
+    def __iter__(self) -> Iterator:
+        source: Iterator = iter(self._examples) if self._examples is not None else iter_all()
+        worker = torch.utils.data.get_worker_info()
+        if worker is not None:
+            source = islice(source, worker.id, None, worker.num_workers)
+        if self.transform is not None:
+            source = map(self.transform, source)
+        return _BackgroundIterator(source, self.max_prefetch)
+
+
+def build_dataloader(
+    dataset: SyntheticIterableDataset,
+    batch_size: int,
+    num_workers: int = 4,
+    prefetch_factor: int = 4,
+    collate_fn: Callable | None = None,
+) -> DataLoader:
+    """Wrap *dataset* in a DataLoader with persistent, prefetching workers.
+
+    The default collate function cannot batch raw SyntheticExample objects,
+    so *dataset* must have a ``transform`` or a *collate_fn* must be given.
+    """
+    _check_torch()
+    if collate_fn is None and dataset.transform is None:
+        raise ValueError(
+            "dataset yields raw SyntheticExample objects; pass a collate_fn "
+            "or give the dataset a transform that returns tensors"
+        )
+    if num_workers == 0:
+        return DataLoader(dataset, batch_size=batch_size, collate_fn=collate_fn)
+    return DataLoader(
+        dataset,
+        batch_size=batch_size,
+        num_workers=num_workers,
+        prefetch_factor=prefetch_factor,
+        persistent_workers=True,
+        collate_fn=collate_fn,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Shared-memory token dataset
+# ---------------------------------------------------------------------------
+
+class SharedTokenDataset(Dataset):
+    """Map-style dataset over one flat token tensor held in shared memory.
+
+    All sequences are concatenated into a single int32 tensor with an int64
+    offsets tensor beside it.  Both are moved to shared memory before the
+    DataLoader forks its workers, so every worker indexes the same physical
+    pages instead of holding its own copy of the corpus.
+    """
+
+    def __init__(self, tokens: torch.Tensor, offsets: torch.Tensor) -> None:
+        _check_torch()
+        self.tokens = tokens.share_memory_()
+        self.offsets = offsets.share_memory_()
+
+    @classmethod
+    def from_table(cls, table: pa.Table, column: str = "input_ids") -> SharedTokenDataset:
+        """Build from a ``list<int32>`` column of a tokenized corpus table."""
+        _check_deps()
+        tokens, offsets = _flat_ids_and_offsets(table, column)
+        return cls(torch.from_numpy(tokens.astype(np.int32)), torch.from_numpy(offsets))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> dict:
+        start, end = self.offsets[idx].item(), self.offsets[idx + 1].item()
+        return {"input_ids": self.tokens[start:end]}
+
+
+# ---------------------------------------------------------------------------
+# Batch collation
+# ---------------------------------------------------------------------------
+
+def pad_collate(batch: list[dict], pad_id: int = 0) -> dict:
+    """Right-pad a batch of ``input_ids`` sequences in a few vectorized calls.
+
+    Returns ``input_ids`` and ``attention_mask`` as ``(batch, max_len)``
+    int32 tensors plus the unpadded ``lengths``.
+    """
+    _check_deps()
+    _check_torch()
+
+    ids = [np.asarray(item["input_ids"], dtype=np.int32) for item in batch]
+    lengths = np.fromiter((len(x) for x in ids), dtype=np.int32, count=len(ids))
+    mask = np.arange(int(lengths.max(initial=0))) < lengths[:, None]
+    out = np.full(mask.shape, pad_id, dtype=np.int32)
+    if ids:
+        out[mask] = np.concatenate(ids)
+    return {
+        "input_ids": torch.from_numpy(out),
+        "attention_mask": torch.from_numpy(mask.astype(np.int32)),
+        "lengths": torch.from_numpy(lengths),
+    }
@@ -0,0 +1,7 @@
+"""Row data for the synthetic dialogue generator.
+
+Pure data: one dict per SyntheticExample, keyed by field name, with one
+submodule per category.  Each submodule is imported only by the generator
+in :mod:`cantor.training.synthetic` that needs it, so loading one category
+never parses the others.
+"""